@@ -1,11 +1,16 @@
 import sys
 import io
 import os
-import yaml
+import json
+import shutil
 import subprocess
 import csv
+import time
+import zipfile
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Windows 控制台 UTF-8 编码支持
 if sys.platform == 'win32':
@@ -15,11 +20,6 @@ if sys.platform == 'win32':
     if isinstance(sys.stderr, io.TextIOWrapper):
         sys.stderr.reconfigure(encoding='utf-8')
 
-try:
-    from openpyxl import load_workbook
-except ImportError:
-    load_workbook = None
-
 
 # ==================== 配置管理 ====================
 
@@ -33,72 +33,282 @@ class Config:
         Args:
             config_path: 配置文件路径，默认为 config.yaml
         """
-        with open(config_path, 'r', encoding='utf-8') as f:
-            self.data = yaml.safe_load(f)
-
-    @property
-    def api_key(self):
-        """获取 API 密钥"""
-        return self.data['api']['translation_api_key']
-
-    @property
-    def api_base_url(self):
-        """获取 API 基础 URL"""
-        return self.data['api']['translation_api_base_url']
-
-    @property
-    def api_model(self):
-        """获取 API 模型名称"""
-        return self.data['api']['translation_api_model']
-
-    @property
-    def input_dir(self):
-        """获取输入目录路径"""
-        return Path(self.data['paths']['input_base'])
-
-    @property
-    def output_dir(self):
-        """获取输出目录路径"""
-        return Path(self.data['paths']['output_base'])
-
-    @property
-    def terminology_dir(self):
-        """获取术语库目录路径"""
-        return Path(self.data['paths']['terminology_folder'])
-
-    @property
-    def pdf_modes(self):
-        """获取 PDF 输出模式列表"""
-        return self.data['babeldoc']['pdf_modes']
-
-    @property
-    def bilingual_settings(self):
-        """获取双语 PDF 配置"""
-        return self.data['babeldoc']['bilingual_settings']
-
-    @property
-    def qps(self):
-        """获取翻译并发数（每秒请求数）"""
-        return self.data['babeldoc']['qps']
-
-    @property
-    def skip_scanned_detection(self):
-        """是否跳过扫描 PDF 检测"""
-        return self.data['babeldoc'].get('skip_scanned_detection', True)
-
-    @property
-    def max_concurrent_files(self):
-        """获取最大并发文件数"""
-        return self.data['batch']['max_concurrent_files']
-
-    @property
-    def resume_enabled(self):
-        """是否启用断点续传"""
-        return self.data['batch']['resume_enabled']
+        self.data = self._load(config_path)
+
+        # 一次性绑定配置项，避免每次访问时重复查字典和构造 Path
+        api = self.data['api']
+        self.api_key = api['translation_api_key']               # API 密钥
+        self.api_base_url = api['translation_api_base_url']     # API 基础 URL
+        self.api_model = api['translation_api_model']           # API 模型名称
+
+        paths = self.data['paths']
+        self.input_dir = Path(paths['input_base'])              # 输入目录
+        self.output_dir = Path(paths['output_base'])            # 输出目录
+        self.terminology_dir = Path(paths['terminology_folder'])  # 术语库目录
+
+        babeldoc = self.data['babeldoc']
+        self.pdf_modes = babeldoc['pdf_modes']                  # PDF 输出模式列表
+        self.bilingual_settings = babeldoc['bilingual_settings']  # 双语 PDF 配置
+        self.qps = babeldoc['qps']                              # 翻译 QPS
+        self.skip_scanned_detection = babeldoc.get('skip_scanned_detection', True)
+
+        batch = self.data['batch']
+        self.max_concurrent_files = batch['max_concurrent_files']  # 最大并发文件数
+        self.resume_enabled = batch['resume_enabled']           # 是否启用断点续传
+        self.stop_on_failure = batch.get('stop_on_failure', False)  # 出错时是否终止其余任务
+
+    def ensure_dirs(self):
+        """创建输入、输出和术语库目录（程序入口处调用一次）"""
+        self.input_dir.mkdir(exist_ok=True)
+        self.output_dir.mkdir(exist_ok=True)
+        self.terminology_dir.mkdir(exist_ok=True)
+
+    @staticmethod
+    def _load(config_path):
+        """
+        读取配置文件，config.yaml 未修改时优先使用 JSON 缓存
+
+        缓存中记录了 config.yaml 的修改时间（纳秒）和大小，两者完全一致时才使用，
+        这样即使配置文件被替换为修改时间更早的版本也不会读到旧值
+
+        Args:
+            config_path: 配置文件路径
+
+        Returns:
+            dict: 配置数据
+        """
+        config_file = Path(config_path)
+        cache_file = Path(str(config_path) + '.cache.json')
+
+        st = config_file.stat()
+        source = [st.st_mtime_ns, st.st_size]
+
+        # 优先读取 JSON 缓存（config.yaml 未修改时）
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+            if isinstance(cache, dict) and cache.get('source') == source and \
+                    isinstance(cache.get('data'), dict):
+                return cache['data']
+        except (OSError, ValueError):
+            pass
+
+        # 仅在缓存失效时才导入 yaml，缩短 --help 和缓存命中时的启动时间
+        import yaml
+        try:
+            from yaml import CSafeLoader
+        except ImportError:
+            from yaml import SafeLoader as CSafeLoader
+
+        with open(config_file, 'r', encoding='utf-8') as f:
+            data = yaml.load(f, Loader=CSafeLoader)
+
+        # 写入 JSON 缓存（先写临时文件再替换，避免留下不完整的缓存），失败时不影响正常运行
+        tmp_file = Path(f"{cache_file}.{os.getpid()}.tmp")
+        try:
+            content = json.dumps({'source': source, 'data': data}, ensure_ascii=False)
+            tmp_file.write_text(content, encoding='utf-8')
+            os.replace(tmp_file, cache_file)
+        except (OSError, TypeError, ValueError):
+            try:
+                tmp_file.unlink()
+            except OSError:
+                pass
+
+        return data
 
 
 # ==================== 术语库管理 ====================
 
+# xlsx（Office Open XML）命名空间
+_NS_MAIN = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+_NS_REL = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}'
+_NS_PKG_REL = '{http://schemas.openxmlformats.org/package/2006/relationships}'
+
+
+def _read_shared_strings(zf):
+    """
+    读取 xlsx 共享字符串表
+
+    Args:
+        zf: 已打开的 xlsx ZipFile
+
+    Returns:
+        list: 共享字符串列表（按索引访问）
+    """
+    if 'xl/sharedStrings.xml' not in zf.namelist():
+        return []
+
+    strings = []
+    with zf.open('xl/sharedStrings.xml') as f:
+        for _, elem in ET.iterparse(f):
+            if elem.tag != _NS_MAIN + 'si':
+                continue
+            # 纯文本 <t> 或富文本 <r><t>，忽略拼音注释 <rPh>
+            parts = []
+            for child in elem:
+                if child.tag == _NS_MAIN + 't':
+                    parts.append(child.text or '')
+                elif child.tag == _NS_MAIN + 'r':
+                    for t in child.iter(_NS_MAIN + 't'):
+                        parts.append(t.text or '')
+            strings.append(''.join(parts))
+            elem.clear()
+
+    return strings
+
+
+def _list_worksheets(zf):
+    """
+    按工作簿中的顺序列出工作表 XML 路径
+
+    Args:
+        zf: 已打开的 xlsx ZipFile
+
+    Returns:
+        list: 工作表在压缩包中的路径列表
+    """
+    try:
+        workbook = ET.fromstring(zf.read('xl/workbook.xml'))
+        rels = ET.fromstring(zf.read('xl/_rels/workbook.xml.rels'))
+    except KeyError:
+        return sorted(n for n in zf.namelist()
+                      if n.startswith('xl/worksheets/') and n.endswith('.xml'))
+
+    targets = {
+        rel.get('Id'): rel.get('Target')
+        for rel in rels.iter(_NS_PKG_REL + 'Relationship')
+    }
+
+    sheets = []
+    for sheet in workbook.iter(_NS_MAIN + 'sheet'):
+        target = targets.get(sheet.get(_NS_REL + 'id'))
+        if not target:
+            continue
+        # Target 可能是相对 xl/ 的路径，也可能是以 / 开头的绝对路径
+        sheets.append(target.lstrip('/') if target.startswith('/') else 'xl/' + target)
+
+    return sheets
+
+
+def _iter_sheet_rows(f, shared_strings):
+    """
+    逐行读取工作表前两列（从第 2 行开始，遇到第一行空行即停止）
+
+    Args:
+        f: 工作表 XML 文件对象
+        shared_strings: 共享字符串列表
+
+    Yields:
+        tuple: (第一列, 第二列)，单元格为空时对应值为 None
+    """
+    tag_c = _NS_MAIN + 'c'
+    tag_v = _NS_MAIN + 'v'
+    tag_is = _NS_MAIN + 'is'
+    tag_t = _NS_MAIN + 't'
+    tag_row = _NS_MAIN + 'row'
+
+    expected_row = 2
+    values = [None, None]
+    row_num = 0
+    cell_index = 0
+
+    for _, elem in ET.iterparse(f):
+        tag = elem.tag
+
+        if tag == tag_c:
+            # 单元格引用如 "B12"，只关心 A、B 两列；缺省引用时按位置推断
+            ref = elem.get('r')
+            if ref:
+                col = ref[:1] if not ref[1:2].isalpha() else ''
+            else:
+                col = 'AB'[cell_index:cell_index + 1]
+            cell_index += 1
+
+            if col == 'A' or col == 'B':
+                cell_type = elem.get('t')
+                if cell_type == 'inlineStr':
+                    inline = elem.find(tag_is)
+                    value = ''.join(t.text or '' for t in inline.iter(tag_t)) \
+                        if inline is not None else None
+                else:
+                    v = elem.find(tag_v)
+                    value = v.text if v is not None else None
+                    if value is not None and cell_type == 's':
+                        value = shared_strings[int(value)]
+                    elif value is not None and cell_type == 'b':
+                        value = 'True' if value == '1' else 'False'
+                values[0 if col == 'A' else 1] = value
+
+        elif tag == tag_row:
+            row_num = int(elem.get('r') or row_num + 1)
+            if row_num >= 2:
+                # 行号不连续说明中间有空行
+                if row_num != expected_row or values == [None, None]:
+                    return
+                yield values[0], values[1]
+                expected_row = row_num + 1
+
+            values = [None, None]
+            cell_index = 0
+            elem.clear()
+
+
+def _parse_glossary_file(excel_file):
+    """
+    解析单个术语库 Excel 文件
+
+    直接解压 xlsx 并流式解析 XML，只读取每个工作表的前两列
+
+    Args:
+        excel_file: Excel 文件路径
+
+    Returns:
+        dict: 术语字典 {英文: 中文}，解析失败时返回空字典
+    """
+    glossary = {}
+
+    try:
+        with zipfile.ZipFile(excel_file) as zf:
+            shared_strings = _read_shared_strings(zf)
+            for sheet_path in _list_worksheets(zf):
+                with zf.open(sheet_path) as f:
+                    for en, zh in _iter_sheet_rows(f, shared_strings):
+                        if not en or not zh:
+                            continue
+                        glossary[en.strip()] = zh.strip()
+    except Exception as e:
+        print(f"加载术语库失败: {excel_file} - {e}")
+
+    return glossary
+
+
+@lru_cache(maxsize=1)
+def _parse_glossary_files(file_keys):
+    """
+    并行解析术语库 Excel 文件（结果按文件签名缓存）
+
+    Args:
+        file_keys: ((路径, 修改时间, 大小), ...) 元组
+
+    Returns:
+        dict: 术语字典 {英文: 中文}
+    """
+    excel_files = [excel_file for excel_file, _, _ in file_keys]
+    if len(excel_files) <= 1:
+        results = map(_parse_glossary_file, excel_files)
+    else:
+        with ThreadPoolExecutor(max_workers=min(8, len(excel_files))) as executor:
+            results = list(executor.map(_parse_glossary_file, excel_files))
+
+    # 按文件顺序合并，后出现的术语覆盖先出现的
+    glossary = {}
+    for result in results:
+        glossary.update(result)
+
+    return glossary
+
+
 class GlossaryManager:
     """术语库管理类 - 加载和处理专业术语翻译"""
 
@@ -115,35 +325,25 @@ class GlossaryManager:
         """
         从 Excel 文件加载术语库
 
+        解析结果以每个 Excel 文件的 (路径, 修改时间, 大小) 为键缓存，
+        供在同一进程中多次调用（如作为库使用）时复用；命令行单次运行中
+        只会加载一次，见 PDFProcessor.prepare_glossary
+
         Returns:
             dict: 术语字典 {英文: 中文}
         """
-        if not load_workbook:
-            print("警告: openpyxl 未安装，无法加载术语库")
-            return {}
-
-        glossary = {}
         excel_files = list(self.terminology_dir.glob("*.xlsx")) + \
                      list(self.terminology_dir.glob("*.xls"))
 
+        file_keys = []
         for excel_file in excel_files:
             try:
-                workbook = load_workbook(excel_file, read_only=True, data_only=True)
-                for sheet_name in workbook.sheetnames:
-                    ws = workbook[sheet_name]
-                    if ws.max_row <= 1:
-                        continue
+                st = excel_file.stat()
+            except OSError:
+                continue
+            file_keys.append((str(excel_file), st.st_mtime, st.st_size))
 
-                    # 从第 2 行开始读取（跳过标题）
-                    for row in ws.iter_rows(min_row=2, values_only=True):
-                        if len(row) >= 2 and row[0] and row[1]:
-                            glossary[str(row[0]).strip()] = str(row[1]).strip()
-
-                workbook.close()
-            except Exception as e:
-                print(f"加载术语库失败: {excel_file} - {e}")
-
-        return glossary
+        return dict(_parse_glossary_files(tuple(file_keys)))
 
     def export_to_csv(self, glossary, output_path):
         """
@@ -159,11 +359,12 @@ class GlossaryManager:
         if not glossary:
             return None
 
-        with open(output_path, 'w', encoding='utf-8', newline='') as f:
-            writer = csv.writer(f)
-            writer.writerow(['source', 'target', 'tgt_lng'])
-            for en, zh in glossary.items():
-                writer.writerow([en, zh, 'zh-CN'])
+        # 先在内存中生成完整内容，再一次性写入文件
+        buf = io.StringIO()
+        writer = csv.writer(buf)
+        writer.writerow(['source', 'target', 'tgt_lng'])
+        writer.writerows((en, zh, 'zh-CN') for en, zh in glossary.items())
+        Path(output_path).write_text(buf.getvalue(), encoding='utf-8', newline='')
 
         return str(output_path)
 
@@ -173,7 +374,7 @@ class GlossaryManager:
 class BabelDOCCommandBuilder:
     """BabelDOC 命令构建器 - 生成 BabelDOC 命令行参数"""
 
-    # BabelDOC 可执行文件路径
+    # BabelDOC 可执行文件默认路径（未设置环境变量且 PATH 中找不到时使用）
     BABELDOC_EXE = r"C:\ProgramData\anaconda3\envs\babeldoc\Scripts\babeldoc.exe"
 
     def __init__(self, config):
@@ -185,20 +386,21 @@ class BabelDOCCommandBuilder:
         """
         self.config = config
 
-    def build(self, pdf_path, glossary_csv=None):
-        """
-        构建 BabelDOC 命令
+        # 可执行文件只解析一次：环境变量 BABELDOC_EXE > PATH 中的 babeldoc > 默认路径
+        self.babeldoc_exe = os.environ.get('BABELDOC_EXE') or \
+            shutil.which('babeldoc') or self.BABELDOC_EXE
 
-        Args:
-            pdf_path: PDF 文件路径
-            glossary_csv: 术语库 CSV 文件路径（可选）
+        # 与具体文件无关的参数只构建一次
+        self._options = self._build_options()
+
+    def _build_options(self):
+        """
+        根据配置构建固定的 BabelDOC 参数（不含输入文件和术语库）
 
         Returns:
-            list: 命令参数列表
+            list: 参数列表
         """
-        cmd = [
-            self.BABELDOC_EXE,
-            "--files", str(pdf_path),
+        options = [
             "--output", str(self.config.output_dir),
 
             # API 配置
@@ -213,28 +415,60 @@ class BabelDOCCommandBuilder:
 
         # 跳过扫描检测
         if self.config.skip_scanned_detection:
-            cmd.append("--skip-scanned-detection")
-
-        # 添加术语库
-        if glossary_csv:
-            cmd.extend(["--glossary-files", glossary_csv])
+            options.append("--skip-scanned-detection")
 
         # PDF 输出模式
         pdf_modes = self.config.pdf_modes
         if 'translated_only' in pdf_modes and 'bilingual' not in pdf_modes:
-            cmd.append("--no-dual")  # 只生成译文 PDF
+            options.append("--no-dual")  # 只生成译文 PDF
         elif 'bilingual' in pdf_modes and 'translated_only' not in pdf_modes:
-            cmd.append("--no-mono")  # 只生成双语 PDF
+            options.append("--no-mono")  # 只生成双语 PDF
 
         # 双语 PDF 配置
         if 'bilingual' in pdf_modes:
             settings = self.config.bilingual_settings
             if settings.get('translated_first', True):
-                cmd.append("--dual-translate-first")
+                options.append("--dual-translate-first")
             if settings.get('alternating_pages', False):
-                cmd.append("--use-alternating-pages-dual")
+                options.append("--use-alternating-pages-dual")
             if not settings.get('watermark', False):
-                cmd.append("--no-watermark")
+                options.append("--no-watermark")
+
+        return options
+
+    def build(self, pdf_path, glossary_csv=None):
+        """
+        构建 BabelDOC 命令
+
+        Args:
+            pdf_path: PDF 文件路径
+            glossary_csv: 术语库 CSV 文件路径（可选）
+
+        Returns:
+            list: 命令参数列表
+        """
+        return self.build_batch([pdf_path], glossary_csv)
+
+    def build_batch(self, pdf_paths, glossary_csv=None):
+        """
+        构建一次处理多个 PDF 的 BabelDOC 命令（重复使用 --files 参数）
+
+        Args:
+            pdf_paths: PDF 文件路径列表
+            glossary_csv: 术语库 CSV 文件路径（可选）
+
+        Returns:
+            list: 命令参数列表
+        """
+        cmd = [self.babeldoc_exe]
+        for pdf_path in pdf_paths:
+            cmd.extend(["--files", str(pdf_path)])
+
+        cmd += self._options
+
+        # 添加术语库
+        if glossary_csv:
+            cmd.extend(["--glossary-files", glossary_csv])
 
         return cmd
 
@@ -244,6 +478,9 @@ class BabelDOCCommandBuilder:
 class PDFProcessor:
     """PDF 处理器 - 处理单个 PDF 文件的翻译"""
 
+    # 单个文件的处理超时（秒）
+    TIMEOUT = 3600
+
     def __init__(self, config):
         """
         初始化 PDF 处理器
@@ -254,11 +491,28 @@ class PDFProcessor:
         self.config = config
         self.glossary_manager = GlossaryManager(config.terminology_dir)
         self.command_builder = BabelDOCCommandBuilder(config)
+        self._glossary_csv = None
+        self._glossary_prepared = False
+
+    def prepare_glossary(self):
+        """
+        加载术语库并导出为 BabelDOC 使用的 CSV（每个处理器只执行一次）
+
+        Returns:
+            str: CSV 文件路径，如果术语库为空则返回 None
+        """
+        if self._glossary_prepared:
+            return self._glossary_csv
+
+        print("加载术语库...")
+        glossary = self.glossary_manager.load_from_excel()
+        if glossary:
+            print(f"✓ 加载了 {len(glossary)} 条术语")
+            csv_path = self.config.output_dir / "glossary.csv"
+            self._glossary_csv = self.glossary_manager.export_to_csv(glossary, csv_path)
 
-        # 创建必要的目录
-        self.config.input_dir.mkdir(exist_ok=True)
-        self.config.output_dir.mkdir(exist_ok=True)
-        self.config.terminology_dir.mkdir(exist_ok=True)
+        self._glossary_prepared = True
+        return self._glossary_csv
 
     def process(self, pdf_path):
         """
@@ -275,14 +529,7 @@ class PDFProcessor:
         print(f"{'='*60}\n")
 
         # 1. 加载术语库
-        print("加载术语库...")
-        glossary = self.glossary_manager.load_from_excel()
-        glossary_csv = None
-
-        if glossary:
-            print(f"✓ 加载了 {len(glossary)} 条术语")
-            csv_path = self.config.output_dir / "glossary.csv"
-            glossary_csv = self.glossary_manager.export_to_csv(glossary, csv_path)
+        glossary_csv = self.prepare_glossary()
 
         # 2. 构建命令
         cmd = self.command_builder.build(pdf_path, glossary_csv)
@@ -295,8 +542,7 @@ class PDFProcessor:
             result = subprocess.run(
                 cmd,
                 check=True,
-                timeout=3600,  # 1 小时超时
-                text=True
+                timeout=self.TIMEOUT  # 1 小时超时
             )
             print("\n✓ 翻译完成！")
             print(f"输出目录: {self.config.output_dir}")
@@ -338,41 +584,142 @@ class BatchProcessor:
         Returns:
             list: PDF 文件路径列表
         """
-        pdf_files = list(self.config.input_dir.rglob("*.pdf"))
+        pdf_files = []
+        stack = [str(self.config.input_dir)]
 
-        # 过滤临时文件
-        pdf_files = [
-            f for f in pdf_files
-            if not any([
-                '_compressed.pdf' in f.name,
-                '_part' in f.name,
-                'temp_splits' in str(f)
-            ])
-        ]
+        while stack:
+            try:
+                entries = os.scandir(stack.pop())
+            except OSError:
+                continue
+
+            with entries:
+                for entry in entries:
+                    name = entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        # 跳过临时拆分目录，不再向下遍历
+                        if 'temp_splits' not in name:
+                            stack.append(entry.path)
+                    # 过滤临时文件
+                    elif name.lower().endswith('.pdf') and \
+                            '_compressed' not in name and '_part' not in name:
+                        pdf_files.append(entry.path)
+
+        return [Path(f) for f in pdf_files]
+
+    def list_output_files(self):
+        """
+        一次性列出输出目录中的文件名
 
-        return pdf_files
+        Returns:
+            set: 文件名集合，输出目录不存在时为空集合
+        """
+        try:
+            with os.scandir(self.config.output_dir) as entries:
+                return {entry.name for entry in entries}
+        except OSError:
+            return set()
 
-    def is_completed(self, pdf_path):
+    def is_completed(self, pdf_path, output_files=None):
         """
         检查文件是否已处理完成（用于断点续传）
 
         Args:
             pdf_path: PDF 文件路径
+            output_files: 输出目录文件名集合（可选，未提供时现场读取）
 
         Returns:
             bool: 已完成返回 True，否则返回 False
         """
+        if output_files is None:
+            output_files = self.list_output_files()
+
         pdf_name = pdf_path.stem
-        output_dir = self.config.output_dir
         pdf_modes = self.config.pdf_modes
 
         expected_files = []
         if 'translated_only' in pdf_modes:
-            expected_files.append(output_dir / f"{pdf_name}_translated.pdf")
+            expected_files.append(f"{pdf_name}_translated.pdf")
         if 'bilingual' in pdf_modes:
-            expected_files.append(output_dir / f"{pdf_name}_dual.pdf")
+            expected_files.append(f"{pdf_name}_dual.pdf")
 
-        return expected_files and all(f.exists() for f in expected_files)
+        return bool(expected_files) and all(f in output_files for f in expected_files)
+
+    def _launch(self, pdf_paths, glossary_csv=None):
+        """
+        启动一个处理多个文件的 BabelDOC 子进程（不等待结束）
+
+        Args:
+            pdf_paths: PDF 文件路径列表
+            glossary_csv: 术语库 CSV 文件路径（可选）
+
+        Returns:
+            subprocess.Popen: 子进程对象，BabelDOC 未找到时返回 None
+        """
+        cmd = self.pdf_processor.command_builder.build_batch(pdf_paths, glossary_csv)
+
+        try:
+            # 多个进程的进度输出会相互交错，批量模式下丢弃 stdout，保留 stderr 错误信息
+            proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL)
+        except FileNotFoundError:
+            print("✗ BabelDOC 未找到，请检查环境配置")
+            return None
+
+        for pdf in pdf_paths:
+            print(f"▶ 开始: {pdf.name}")
+        return proc
+
+    def _wait_any(self, running, on_poll=None, interval=0.5):
+        """
+        轮询子进程，直到至少一个结束（或超时被终止）
+
+        Args:
+            running: 运行中的子进程字典 {Popen: (文件列表, 截止时间)}，结束的进程会被移除
+            on_poll: 每轮未有进程结束时调用的回调（可选，用于报告进度）
+            interval: 轮询间隔（秒）
+
+        Returns:
+            list: 已结束进程的 [(文件列表, 是否成功), ...]
+        """
+        while True:
+            finished = []
+            now = time.monotonic()
+
+            for proc, (pdfs, deadline) in list(running.items()):
+                returncode = proc.poll()
+                if returncode is None:
+                    if now < deadline:
+                        continue
+                    proc.kill()
+                    proc.wait()
+                    print(f"✗ 处理超时: {', '.join(pdf.name for pdf in pdfs)}")
+
+                del running[proc]
+                finished.append((pdfs, returncode == 0))
+
+            if finished:
+                return finished
+            if on_poll:
+                on_poll()
+            time.sleep(interval)
+
+    def _terminate_all(self, running):
+        """
+        终止所有运行中的子进程
+
+        Args:
+            running: 运行中的子进程字典 {Popen: (文件列表, 截止时间)}，会被清空
+
+        Returns:
+            list: 被终止进程的文件列表
+        """
+        terminated = []
+        for proc, (pdfs, _) in running.items():
+            proc.kill()
+            proc.wait()
+            terminated.append(pdfs)
+        running.clear()
+        return terminated
 
     def process(self):
         """
@@ -397,9 +744,10 @@ class BatchProcessor:
         if self.config.resume_enabled:
             to_process = []
             skipped = []
+            output_files = self.list_output_files()
 
             for pdf in pdf_files:
-                if self.is_completed(pdf):
+                if self.is_completed(pdf, output_files):
                     skipped.append(pdf)
                 else:
                     to_process.append(pdf)
@@ -424,6 +772,9 @@ class BatchProcessor:
             print("已取消")
             return 0, 0
 
+        # 术语库只加载、导出一次，供所有文件共享
+        glossary_csv = self.pdf_processor.prepare_glossary()
+
         # 5. 并发处理
         max_workers = self.config.max_concurrent_files
         print(f"\n开始处理（并发数: {max_workers}）...\n")
@@ -431,25 +782,70 @@ class BatchProcessor:
         success_count = 0
         failure_count = 0
 
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            future_to_pdf = {
-                executor.submit(self.pdf_processor.process, pdf): pdf
-                for pdf in pdf_files
-            }
-
-            for future in as_completed(future_to_pdf):
-                pdf = future_to_pdf[future]
-                try:
-                    success = future.result()
-                    if success:
-                        success_count += 1
-                        print(f"✓ 完成: {pdf.name}")
-                    else:
-                        failure_count += 1
-                        print(f"✗ 失败: {pdf.name}")
-                except Exception as e:
+        # 将文件均分为至多 max_workers 组，每组由一个 BabelDOC 进程处理，
+        # 分摊进程启动和模型初始化的开销
+        chunk_size = -(-len(pdf_files) // max_workers)
+        chunks = [
+            pdf_files[i:i + chunk_size]
+            for i in range(0, len(pdf_files), chunk_size)
+        ]
+
+        running = {}  # {Popen: (文件列表, 截止时间)}
+        reported = set()  # 已报告结果的文件
+
+        # 开始前已有输出的文件（未启用断点续传时）不能以输出文件判断是否完成
+        output_files = self.list_output_files()
+        stale = {pdf for pdf in pdf_files if self.is_completed(pdf, output_files)}
+
+        def record(pdfs, success):
+            nonlocal success_count, failure_count
+            # 进程失败时按输出文件逐个判断，已生成结果的文件仍算成功
+            output_files = set() if success else self.list_output_files()
+            for pdf in pdfs:
+                if pdf in reported:
+                    continue
+                reported.add(pdf)
+                if success or (pdf not in stale and self.is_completed(pdf, output_files)):
+                    success_count += 1
+                    print(f"✓ 完成: {pdf.name}")
+                else:
                     failure_count += 1
-                    print(f"✗ 异常: {pdf.name} - {e}")
+                    print(f"✗ 失败: {pdf.name}")
+
+        for chunk in chunks:
+            if failure_count and self.config.stop_on_failure:
+                record(chunk, False)
+                continue
+
+            proc = self._launch(chunk, glossary_csv)
+            if proc is None:
+                record(chunk, False)
+            else:
+                deadline = time.monotonic() + PDFProcessor.TIMEOUT * len(chunk)
+                running[proc] = (chunk, deadline)
+
+        def report_progress():
+            # 同一组的进程仍在运行时，按输出文件逐个报告已完成的文件
+            output_files = self.list_output_files()
+            done = [
+                pdf
+                for pdfs, _ in running.values()
+                for pdf in pdfs
+                if pdf not in reported and pdf not in stale
+                and self.is_completed(pdf, output_files)
+            ]
+            if done:
+                record(done, True)
+
+        while running:
+            for pdfs, success in self._wait_any(running, report_progress):
+                record(pdfs, success)
+
+            # 快速失败：出现失败后终止其余任务
+            if failure_count and self.config.stop_on_failure and running:
+                print("\n✗ 出现失败，终止其余任务")
+                for pdfs in self._terminate_all(running):
+                    record(pdfs, False)
 
         # 6. 汇总
         print("\n" + "="*60)
@@ -519,6 +915,7 @@ def main():
     try:
         # 加载配置
         config = Config()
+        config.ensure_dirs()
 
         # 单文件处理模式
         if len(sys.argv) > 1: